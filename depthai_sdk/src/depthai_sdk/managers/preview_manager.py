@@ -1,11 +1,13 @@
 import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from queue import Queue
 
 import cv2
 import depthai as dai
 
-from ..previews import Previews, MouseClickTracker
+from ..previews import Previews, PreviewConfig, PreviewDecoder, PREVIEW_DECODERS, MouseClickTracker, FrameArena
 import numpy as np
 
 
@@ -17,7 +19,7 @@ class PreviewManager:
     #: dict: Contains name -> frame mapping that can be used to modify specific frames directly
     frames = {}
 
-    def __init__(self, display=[], nnSource=None, colorMap=None, depthConfig=None, dispMultiplier=255/96, mouseTracker=False, decode=False, fpsHandler=None, createWindows=True):
+    def __init__(self, display=[], nnSource=None, colorMap=None, depthConfig=None, dispMultiplier=255/96, mouseTracker=False, decode=False, fpsHandler=None, createWindows=True, reuseDecodeBuffers=False, useCuda=False, parallelDecode=False):
         """
         Args:
             display (list, Optional): List of :obj:`depthai_sdk.Previews` objects representing the streams to display
@@ -29,21 +31,156 @@ class PreviewManager:
             dispMultiplier (float, Optional): Multiplier used for depth <-> disparity calculations (calculated on baseline and focal)
             depthConfig (depthai.StereoDepthConfig, optional): Configuration used for depth <-> disparity calculations
             createWindows (bool, Optional): If True, will create preview windows using OpenCV (enabled by default)
+            reuseDecodeBuffers (bool, Optional): If set to :code:`True` (and :code:`decode` is enabled), decodes each frame into
+                the memory of the previous frame of the same stream. Saves an allocation per frame, but frames passed to
+                prepareFrames callbacks are only valid until the next frame of the stream is decoded
+            useCuda (bool, Optional): If set to :code:`True`, will colorize depth frames on GPU using :code:`cv2.cuda`, when
+                OpenCV is built with CUDA support and a CUDA device is available
+            parallelDecode (bool, Optional): If set to :code:`True` (and :code:`decode` is enabled), will decode the streams
+                concurrently on a thread pool sized to the CPUs available to the process. Only helps on multi-core hosts
+                displaying several MJPEG streams
         """
-        self.nnSource = nnSource
+        self._nnSource = nnSource
         if colorMap is not None:
-            self.colorMap = colorMap
+            self._colorMap = colorMap
         else:
-            self.colorMap = cv2.applyColorMap(np.arange(256, dtype=np.uint8), cv2.COLORMAP_JET)
-            self.colorMap[0] = [0, 0, 0]
-        self.decode = decode
-        self.dispMultiplier = dispMultiplier
+            self._colorMap = cv2.applyColorMap(np.arange(256, dtype=np.uint8), cv2.COLORMAP_JET)
+            self._colorMap[0] = [0, 0, 0]
+        self._decode = decode
+        self._reuseDecodeBuffers = reuseDecodeBuffers
+        self._useCuda = useCuda
+        self._parallelDecode = parallelDecode
+        self._dispMultiplier = dispMultiplier
         self._depthConfig = depthConfig
+        self._dispScaleFactor = None
+        self._baseline = None
+        self._fov = None
+        self._focal = None
         self._fpsHandler = fpsHandler
         self._mouseTracker = MouseClickTracker() if mouseTracker else None
         self._display = display
         self._createWindows = createWindows
         self._rawFrames = {}
+        self._frameArena = FrameArena()
+        self._depthCudaScratch = None
+        self._decodeBuffers = {}
+        self._decodePool = None
+        self._updatePreviewConfig()
+
+    def _updatePreviewConfig(self):
+        self._previewConfig = PreviewConfig(
+            decode=self._decode,
+            nnSource=self._nnSource,
+            dispMultiplier=self._dispMultiplier,
+            colorMap=self._colorMap,
+            colorMapLut=PreviewDecoder.buildColorMapLut(self._colorMap),
+            colorMapLut565=None,  # built on first disparityColor565 call
+            depthU8Scale=None,  # calculated on first depth frame
+            reuseDecodeBuffers=self._reuseDecodeBuffers,
+            useCuda=self._useCuda,
+        )
+
+    @property
+    def nnSource(self):
+        """
+        str: Specifies NN source camera
+        """
+        return self._nnSource
+
+    @nnSource.setter
+    def nnSource(self, nnSource):
+        self._nnSource = nnSource
+        self._updatePreviewConfig()
+
+    @property
+    def colorMap(self):
+        """
+        cv2 color map: Color map applied on the depth frames
+        """
+        return self._colorMap
+
+    @colorMap.setter
+    def colorMap(self, colorMap):
+        self._colorMap = colorMap
+        self._updatePreviewConfig()
+
+    @property
+    def decode(self):
+        """
+        bool: Whether the received frames are decoded assuming they were encoded with MJPEG encoding
+        """
+        return self._decode
+
+    @decode.setter
+    def decode(self, decode):
+        self._decode = decode
+        self._updatePreviewConfig()
+
+    @property
+    def dispMultiplier(self):
+        """
+        float: Multiplier used for depth <-> disparity calculations
+        """
+        return self._dispMultiplier
+
+    @dispMultiplier.setter
+    def dispMultiplier(self, dispMultiplier):
+        self._dispMultiplier = dispMultiplier
+        self._updatePreviewConfig()
+
+    @property
+    def dispScaleFactor(self):
+        """
+        float: Depth <-> disparity scale factor (:code:`baseline * focal`). If not set, it's calculated from
+        :attr:`baseline`, :attr:`fov` and :attr:`focal` on first depth frame
+        """
+        return self._dispScaleFactor
+
+    @dispScaleFactor.setter
+    def dispScaleFactor(self, dispScaleFactor):
+        self._dispScaleFactor = dispScaleFactor
+        self._updatePreviewConfig()
+
+    @property
+    def baseline(self):
+        """
+        float: Stereo baseline in mm, OAK-D default (75) is used if not set. Setting it resets :attr:`dispScaleFactor`
+        """
+        return self._baseline
+
+    @baseline.setter
+    def baseline(self, baseline):
+        self._baseline = baseline
+        self._dispScaleFactor = None
+        self._updatePreviewConfig()
+
+    @property
+    def fov(self):
+        """
+        float: Horizontal field of view of the stereo camera in degrees, OAK-D default (71.86) is used if not set.
+        Setting it resets :attr:`dispScaleFactor`
+        """
+        return self._fov
+
+    @fov.setter
+    def fov(self, fov):
+        self._fov = fov
+        self._dispScaleFactor = None
+        self._updatePreviewConfig()
+
+    @property
+    def focal(self):
+        """
+        float: Focal length in pixels, estimated from :attr:`fov` and depth frame width if not set.
+        Setting it resets :attr:`dispScaleFactor`
+        """
+        return self._focal
+
+    @focal.setter
+    def focal(self, focal):
+        self._focal = focal
+        self._dispScaleFactor = None
+        self._updatePreviewConfig()
 
     def collectCalibData(self, device):
         """
@@ -92,6 +229,18 @@ class PreviewManager:
         if Previews.depth.name in self._display and Previews.depthRaw.name not in self._display:
             self.outputQueues.append(device.getOutputQueue(name=Previews.depthRaw.name, maxSize=1, blocking=False))
 
+        if self._decodePool is not None:
+            self._decodePool.shutdown()
+            self._decodePool = None
+        if self._parallelDecode and self._decode and len(self.outputQueues) > 1:
+            try:
+                # respects CPU affinity (e.g. taskset or container cpusets), unlike os.cpu_count
+                cpus = len(os.sched_getaffinity(0))
+            except AttributeError:  # not available on Windows and macOS
+                cpus = os.cpu_count() or 1
+            # JPEG decoders mostly run in native code with the GIL released, so the streams are decoded concurrently
+            self._decodePool = ThreadPoolExecutor(max_workers=min(len(self.outputQueues), cpus))
+
     def closeQueues(self):
         """
         Closes output queues for requested preview streams
@@ -99,6 +248,17 @@ class PreviewManager:
 
         for queue in self.outputQueues:
             queue.close()
+        if self._decodePool is not None:
+            self._decodePool.shutdown()
+            self._decodePool = None
+
+    def _decodePackets(self, packets):
+        """
+        Converts (name, packet) pairs into frames, in order, using the decode pool if available
+        """
+        if self._decodePool is not None and len(packets) > 1:
+            return self._decodePool.map(lambda item: PREVIEW_DECODERS[item[0]](item[1], self), packets)
+        return [PREVIEW_DECODERS[name](packet, self) for name, packet in packets]
 
     def _processFrame(self, frame, queueName):
         if self._fpsHandler is not None:
@@ -111,7 +271,7 @@ class PreviewManager:
 
         if self._mouseTracker is not None:
             if name == Previews.disparity.name:
-                rawFrame = packet.getFrame() if not self.decode else cv2.imdecode(packet.getData(), cv2.IMREAD_GRAYSCALE)
+                rawFrame = packet.getFrame() if not self.decode else PreviewDecoder.jpegDecode(packet.getData(), cv2.IMREAD_GRAYSCALE)
                 self._mouseTracker.extractValue(Previews.disparity.name, rawFrame)
                 self._mouseTracker.extractValue(Previews.disparityColor.name, rawFrame)
             if name == Previews.depthRaw.name:
@@ -124,12 +284,12 @@ class PreviewManager:
         if name == Previews.disparity.name and Previews.disparityColor.name in self._display:
             if self._fpsHandler is not None:
                 self._fpsHandler.tick(Previews.disparityColor.name)
-            self._rawFrames[Previews.disparityColor.name] = Previews.disparityColor.value(frame, self)
+            self._rawFrames[Previews.disparityColor.name] = PREVIEW_DECODERS[Previews.disparityColor.name](frame, self)
 
         if name == Previews.depthRaw.name and Previews.depth.name in self._display:
             if self._fpsHandler is not None:
                 self._fpsHandler.tick(Previews.depth.name)
-            self._rawFrames[Previews.depth.name] = Previews.depth.value(frame, self)
+            self._rawFrames[Previews.depth.name] = PREVIEW_DECODERS[Previews.depth.name](frame, self)
 
 
     def prepareFrames(self, blocking=False, callback=None):
@@ -141,40 +301,49 @@ class PreviewManager:
             blocking (bool, Optional): If set to :code:`True`, will wait for a packet in each queue to be available
             callback (func, Optional): Function that will be executed once packet with frame has arrived
         """
+        packets = []
         for queue in self.outputQueues:
             if blocking:
                 packet = queue.get()
             else:
                 packet = queue.tryGet()
             if packet is not None:
-                frame = getattr(Previews, queue.getName()).value(packet, self)
-                if frame is None:
-                    print("[WARNING] Conversion of the {} frame has failed! (None value detected)".format(queue.getName()))
-                    continue
-                frame = self._processFrame(frame, queue.getName())
-                if queue.getName() in self._display:
-                    if callback is not None:
-                        callback(frame, queue.getName())
-                self._addRawFrame(frame, packet, queue.getName())
-
-        for name in self._rawFrames:
-            newFrame = self._rawFrames[name].copy()
+                packets.append((queue.getName(), packet))
+
+        for (name, packet), frame in zip(packets, self._decodePackets(packets)):
+            if frame is None:
+                print("[WARNING] Conversion of the {} frame has failed! (None value detected)".format(name))
+                continue
+            frame = self._processFrame(frame, name)
+            if name in self._display:
+                if callback is not None:
+                    # decoders may return strided views (e.g. mirrored nnInput), OpenCV drawing needs contiguous memory
+                    callback(frame if frame.flags.c_contiguous else np.ascontiguousarray(frame), name)
+            self._addRawFrame(frame, packet, name)
+
+        self._storeFrames()
+
+    def _storeFrames(self):
+        # every frame is a new array, so frames handed out earlier (e.g. queued to another thread) are never modified
+        for name, rawFrame in self._rawFrames.items():
             if name == Previews.depthRaw.name:
-                newFrame = cv2.normalize(newFrame, None, 255, 0, cv2.NORM_INF, cv2.CV_8UC1)
-            self.frames[name] = newFrame
+                self.frames[name] = cv2.normalize(rawFrame, None, 255, 0, cv2.NORM_INF, cv2.CV_8UC1)
+            else:
+                self.frames[name] = rawFrame.copy()
 
     def showFrames(self, callback=None):
         """
-        Displays stored frame onto preview windows.
+        Displays stored frame onto preview windows. Overlays (selected point, FPS) are drawn directly onto the frames
+        stored by the last :meth:`prepareFrames` call, frames stored by earlier calls are left intact.
 
         Args:
             callback (func, Optional): Function that will be executed right before :code:`cv2.imshow`
         """
         for name, frame in self.frames.items():
             if self._mouseTracker is not None:
-                point = self._mouseTracker.points.get(name)
-                value = self._mouseTracker.values.get(name)
+                point = self._mouseTracker.getPoint(name)
                 if point is not None:
+                    value = self._mouseTracker.getValue(name)
                     cv2.circle(frame, point, 3, (255, 255, 255), -1)
                     cv2.putText(frame, str(value), (point[0] + 5, point[1] + 5), cv2.FONT_HERSHEY_TRIPLEX, 0.5, (0, 0, 0), 4, cv2.LINE_AA)
                     cv2.putText(frame, str(value), (point[0] + 5, point[1] + 5), cv2.FONT_HERSHEY_TRIPLEX, 0.5, (255, 255, 255), 1, cv2.LINE_AA)
@@ -198,7 +367,8 @@ class PreviewManager:
 
     def get(self, name):
         """
-        Returns a frame assigned to specified preview
+        Returns a frame assigned to specified preview. Each :meth:`prepareFrames` call stores new frame arrays, so the
+        returned frame is not modified by subsequent calls (apart from overlays drawn onto it by :meth:`showFrames`)
 
         Returns:
             numpy.ndarray: Resolved frame, will default to :code:`None` if not present
@@ -268,18 +438,14 @@ class SyncedPreviewManager(PreviewManager):
                 packets = None
             if packets is not None:
                 self.nnSyncSeq = min(map(lambda packet: packet.getSequenceNum(), packets.values()))
-                for name, packet in packets.items():
-                    frame = getattr(Previews, name).value(packet, self)
+                packets = list(packets.items())
+                for (name, packet), frame in zip(packets, self._decodePackets(packets)):
                     if frame is None:
                         print("[WARNING] Conversion of the {} frame has failed! (None value detected)".format(name))
                         continue
                     frame = self._processFrame(frame, name)
                     if callback is not None:
-                        callback(frame, name)
+                        callback(frame if frame.flags.c_contiguous else np.ascontiguousarray(frame), name)
                     self._addRawFrame(frame, packet, name)
 
-        for name in self._rawFrames:
-            newFrame = self._rawFrames[name].copy()
-            if name == Previews.depthRaw.name:
-                newFrame = cv2.normalize(newFrame, None, 255, 0, cv2.NORM_INF, cv2.CV_8UC1)
-            self.frames[name] = newFrame
+        self._storeFrames()
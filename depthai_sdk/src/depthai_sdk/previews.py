@@ -1,6 +1,9 @@
 import enum
+import inspect
 import math
-from functools import partial
+from collections import defaultdict, namedtuple
+from functools import partial, lru_cache
+from types import MappingProxyType
 
 import numpy as np
 
@@ -10,27 +13,172 @@ except ImportError:
     cv2 = None
 
 try:
-    from turbojpeg import TurboJPEG, TJFLAG_FASTUPSAMPLE, TJFLAG_FASTDCT, TJPF_GRAY
+    from turbojpeg import TurboJPEG, TJFLAG_FASTUPSAMPLE, TJFLAG_FASTDCT, TJPF_GRAY, TJPF_BGR
 
     turbo = TurboJPEG()
+    # decoding into a caller-provided array is only supported by newer PyTurboJPEG releases
+    _turboDecodeDst = 'dst' in inspect.signature(turbo.decode).parameters
 except:
     turbo = None
+    _turboDecodeDst = False
+
+try:
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+    @numba.njit(cache=True, parallel=True, fastmath=True)
+    def _depthToU8(depth, scale, out):
+        # depth -> uint8 disparity in a single vectorized pass, invalid (0) depth maps to 0
+        h, w = depth.shape
+        for i in numba.prange(h):
+            for j in range(w):
+                d = depth[i, j]
+                if d == 0:
+                    out[i, j] = 0
+                else:
+                    v = scale / d
+                    out[i, j] = 255 if v > 255 else np.uint8(v)
+else:
+    _depthToU8 = None
+
+
+#: Preview parameters read by :obj:`PreviewDecoder` on every frame, bundled so that decoders need a single attribute
+#: load. Rebuilt by :obj:`depthai_sdk.managers.PreviewManager` whenever one of the parameters changes.
+PreviewConfig = namedtuple('PreviewConfig', ['decode', 'nnSource', 'dispMultiplier', 'colorMap', 'colorMapLut',
+                                             'colorMapLut565', 'depthU8Scale', 'reuseDecodeBuffers', 'useCuda'])
+
+# used when decoders are called without a manager, color map LUTs are resolved to COLORMAP_JET on demand
+_DEFAULT_PREVIEW_CONFIG = PreviewConfig(decode=False, nnSource=None, dispMultiplier=255 / 96, colorMap=None,
+                                        colorMapLut=None, colorMapLut565=None, depthU8Scale=None,
+                                        reuseDecodeBuffers=False, useCuda=False)
+
+
+@lru_cache(maxsize=None)
+def _cudaEnabled():
+    try:
+        # cudaarithm (threshold/divide) and cudaimgproc (createLookUpTable) are required besides a CUDA device
+        return cv2 is not None and hasattr(cv2.cuda, "threshold") and hasattr(cv2.cuda, "createLookUpTable") \
+            and cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+
+class FrameArena:
+    """
+    Hands out reusable frame buffers keyed by shape and dtype, so that previews don't allocate new arrays every frame.
+
+    Used internally by :obj:`depthai_sdk.managers.PreviewManager` for depth conversion scratch buffers, frames handed
+    out to the user are never taken from the arena
+    """
+
+    def __init__(self):
+        self._free = defaultdict(list)
+
+    def get(self, shape, dtype):
+        """
+        Returns a buffer of requested shape and dtype, reusing a released one if available
+
+        Args:
+            shape (tuple): Shape of the buffer
+            dtype (numpy.dtype): Data type of the buffer
+
+        Returns:
+            numpy.ndarray: Uninitialized buffer
+        """
+        free = self._free[(shape, np.dtype(dtype))]
+        return free.pop() if len(free) > 0 else np.empty(shape, dtype=dtype)
+
+    def release(self, buffer):
+        """
+        Returns the buffer to the arena, making it available for subsequent :meth:`get` calls.
+        The buffer must not be used after being released.
+
+        Args:
+            buffer (numpy.ndarray): Buffer obtained from :meth:`get`
+        """
+        self._free[(buffer.shape, buffer.dtype)].append(buffer)
+
+
+class _CudaDepthScratch:
+    """
+    Persistent GPU buffers used to colorize depth frames with :code:`cv2.cuda`
+    """
+
+    #: float: Added to invalid (0) depth pixels so that their disparity evaluates to 0
+    INVALID_OFFSET = 1e30
+
+    def __init__(self, shape):
+        self.shape = shape
+        self.stream = cv2.cuda_Stream()
+        self.depth = cv2.cuda_GpuMat()
+        self.depthF32 = cv2.cuda_GpuMat()
+        self.invalid = cv2.cuda_GpuMat()
+        self.scale = cv2.cuda_GpuMat()
+        self.scaleValue = None
+        self.dispF32 = cv2.cuda_GpuMat()
+        self.disp = cv2.cuda_GpuMat()
+        self.dispBgr = cv2.cuda_GpuMat()
+        self.color = cv2.cuda_GpuMat()
+        self.lut = None
+        self.lutSource = None
 
 
 class PreviewDecoder:
 
     @staticmethod
-    def jpegDecode(data, type):
+    def jpegDecode(data, type, dst=None):
+        """
+        Decodes JPEG encoded frame using the fastest decoder available (PyTurboJPEG, simplejpeg or OpenCV)
+
+        Args:
+            data (numpy.ndarray): JPEG encoded data
+            type (int): OpenCV imread flag, e.g. :code:`cv2.IMREAD_COLOR`
+            dst (numpy.ndarray, optional): Buffer to decode into, avoiding allocation, usually previous frame of the same
+                stream. Used if it is large enough (simplejpeg) or has the exact output shape (PyTurboJPEG). Its previous
+                contents are overwritten, so it must not be referenced anywhere else anymore
+
+        Returns:
+            numpy.ndarray: Decoded frame, sharing memory with :code:`dst` if it was used
+        """
         if turbo is not None:
-            if type == cv2.IMREAD_GRAYSCALE:
-                return turbo.decode(data, flags=TJFLAG_FASTUPSAMPLE | TJFLAG_FASTDCT, pixel_format=TJPF_GRAY)
             if type == cv2.IMREAD_UNCHANGED:
                 return turbo.decode_to_yuv(data, flags=TJFLAG_FASTUPSAMPLE | TJFLAG_FASTDCT)
-            else:
-                return turbo.decode(data, flags=TJFLAG_FASTUPSAMPLE | TJFLAG_FASTDCT)
+            pixelFormat = TJPF_GRAY if type == cv2.IMREAD_GRAYSCALE else TJPF_BGR
+            if _turboDecodeDst and dst is not None:
+                try:
+                    return turbo.decode(data, flags=TJFLAG_FASTUPSAMPLE | TJFLAG_FASTDCT, pixel_format=pixelFormat, dst=dst)
+                except ValueError:
+                    pass  # PyTurboJPEG rejects dst of other shape than the frame, e.g. after a resolution change
+            return turbo.decode(data, flags=TJFLAG_FASTUPSAMPLE | TJFLAG_FASTDCT, pixel_format=pixelFormat)
+        elif simplejpeg is not None and type != cv2.IMREAD_UNCHANGED:
+            colorspace = 'GRAY' if type == cv2.IMREAD_GRAYSCALE else 'BGR'
+            try:
+                frame = simplejpeg.decode_jpeg(data, colorspace=colorspace, fastdct=True, fastupsample=True, buffer=dst)
+            except ValueError:
+                if dst is None:
+                    raise
+                # dst too small for the frame, e.g. after a resolution change
+                frame = simplejpeg.decode_jpeg(data, colorspace=colorspace, fastdct=True, fastupsample=True)
+            return frame[:, :, 0] if colorspace == 'GRAY' else frame
         else:
             return cv2.imdecode(data, type)
 
+    @staticmethod
+    def _jpegDecodeReusing(packet, type, manager, name):
+        if not manager._previewConfig.reuseDecodeBuffers:
+            return PreviewDecoder.jpegDecode(packet.getData(), type)
+        frame = PreviewDecoder.jpegDecode(packet.getData(), type, manager._decodeBuffers.get(name))
+        # decoded frame is reused as the output buffer for the next frame of this stream
+        manager._decodeBuffers[name] = frame
+        return frame
+
     @staticmethod
     def nnInput(packet, manager=None):
         """
@@ -41,16 +189,18 @@ class PreviewDecoder:
             manager (depthai_sdk.managers.PreviewManager, optional): PreviewManager instance
 
         Returns:
-            numpy.ndarray: Ready to use OpenCV frame
+            numpy.ndarray: Ready to use OpenCV frame. For rectified NN sources this is a mirrored, non-contiguous view,
+            wrap it with :code:`np.ascontiguousarray` before drawing on it with OpenCV
         """
         # if manager is not None and manager.decode: TODO change once passthrough frame type (8) is supported by VideoEncoder
         if False:
             frame = PreviewDecoder.jpegDecode(packet.getData(), cv2.IMREAD_COLOR)
         else:
             frame = packet.getCvFrame()
-        if hasattr(manager, "nnSource") and manager.nnSource in (
-                Previews.rectifiedLeft.name, Previews.rectifiedRight.name):
-            frame = cv2.flip(frame, 1)
+        cfg = manager._previewConfig if manager is not None else _DEFAULT_PREVIEW_CONFIG
+        if cfg.nnSource in _RECTIFIED_NAMES:
+            # mirrored stride view instead of a copy, use np.ascontiguousarray where contiguous memory is required
+            frame = frame[:, ::-1]
         return frame
 
     @staticmethod
@@ -63,10 +213,11 @@ class PreviewDecoder:
             manager (depthai_sdk.managers.PreviewManager, optional): PreviewManager instance
 
         Returns:
-            numpy.ndarray: Ready to use OpenCV frame
+            numpy.ndarray: Ready to use OpenCV frame. If manager decodes with :code:`reuseDecodeBuffers` enabled, the frame
+            is overwritten by the next frame of this stream, copy it to keep it longer
         """
-        if manager is not None and manager.decode:
-            return PreviewDecoder.jpegDecode(packet.getData(), cv2.IMREAD_COLOR)
+        if manager is not None and manager._previewConfig.decode:
+            return PreviewDecoder._jpegDecodeReusing(packet, cv2.IMREAD_COLOR, manager, Previews.color.name)
         else:
             return packet.getCvFrame()
 
@@ -80,10 +231,11 @@ class PreviewDecoder:
             manager (depthai_sdk.managers.PreviewManager, optional): PreviewManager instance
 
         Returns:
-            numpy.ndarray: Ready to use OpenCV frame
+            numpy.ndarray: Ready to use OpenCV frame. If manager decodes with :code:`reuseDecodeBuffers` enabled, the frame
+            is overwritten by the next frame of this stream, copy it to keep it longer
         """
-        if manager is not None and manager.decode:
-            return PreviewDecoder.jpegDecode(packet.getData(), cv2.IMREAD_GRAYSCALE)
+        if manager is not None and manager._previewConfig.decode:
+            return PreviewDecoder._jpegDecodeReusing(packet, cv2.IMREAD_GRAYSCALE, manager, Previews.left.name)
         else:
             return packet.getCvFrame()
 
@@ -97,10 +249,11 @@ class PreviewDecoder:
             manager (depthai_sdk.managers.PreviewManager, optional): PreviewManager instance
 
         Returns:
-            numpy.ndarray: Ready to use OpenCV frame
+            numpy.ndarray: Ready to use OpenCV frame. If manager decodes with :code:`reuseDecodeBuffers` enabled, the frame
+            is overwritten by the next frame of this stream, copy it to keep it longer
         """
-        if manager is not None and manager.decode:
-            return PreviewDecoder.jpegDecode(packet.getData(), cv2.IMREAD_GRAYSCALE)
+        if manager is not None and manager._previewConfig.decode:
+            return PreviewDecoder._jpegDecodeReusing(packet, cv2.IMREAD_GRAYSCALE, manager, Previews.right.name)
         else:
             return packet.getCvFrame()
 
@@ -158,6 +311,25 @@ class PreviewDecoder:
         else:
             return packet.getFrame()
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _computeDispScale(width, baseline, fov, focal=None):
+        """
+        Calculates depth <-> disparity scale factor (:code:`baseline * focal`), memoized per input parameters
+
+        Args:
+            width (int): Width of the depth frame, used to estimate focal length if not provided
+            baseline (float): Stereo baseline in mm
+            fov (float): Horizontal field of view of the stereo camera in degrees
+            focal (float, optional): Focal length in pixels, estimated from :code:`width` and :code:`fov` if not provided
+
+        Returns:
+            float: Disparity scale factor
+        """
+        if focal is None:
+            focal = width / (2. * math.tan(math.radians(fov / 2)))
+        return baseline * focal
+
     @staticmethod
     def depth(depthRaw, manager=None):
         """
@@ -170,27 +342,88 @@ class PreviewDecoder:
         Returns:
             numpy.ndarray: Ready to use OpenCV frame
         """
-        if getattr(manager, "_depthConfig", None) is None:
-            raise RuntimeError("Depth config has to be provided before decoding depth data")
+        cfg = manager._previewConfig if manager is not None else _DEFAULT_PREVIEW_CONFIG
+        depthU8Scale = cfg.depthU8Scale
+        if depthU8Scale is None:
+            if getattr(manager, "_depthConfig", None) is None:
+                raise RuntimeError("Depth config has to be provided before decoding depth data")
+
+            maxDisp = manager._depthConfig.getMaxDisparity()
+            algorithmControl = manager._depthConfig.get().algorithmControl
+            subpixelLevels = pow(2, algorithmControl.subpixelFractionalBits)
+            dispIntegerLevels = maxDisp if not algorithmControl.enableSubpixel else maxDisp / subpixelLevels
+            dispScaleFactor = manager.dispScaleFactor
+            if dispScaleFactor is None:
+                baseline, fov = manager.baseline, manager.fov
+                dispScaleFactor = PreviewDecoder._computeDispScale(
+                    depthRaw.shape[1], baseline if baseline is not None else 75, fov if fov is not None else 71.86,
+                    manager.focal
+                )
+                # set directly, the setter would rebuild preview config replaced right below
+                manager._dispScaleFactor = dispScaleFactor
+            # depth -> uint8 disparity folded into a single scalar, reset by PreviewManager when any of its inputs change
+            depthU8Scale = dispScaleFactor * 255. / dispIntegerLevels
+            manager._previewConfig = cfg._replace(depthU8Scale=depthU8Scale)
+
+        if cfg.useCuda and _cudaEnabled():
+            return PreviewDecoder._depthColorCuda(depthRaw, depthU8Scale, manager)
+
+        arena = manager._frameArena
+        dispFrame = arena.get(depthRaw.shape, np.uint8)
+        if _depthToU8 is not None:
+            _depthToU8(depthRaw, depthU8Scale, dispFrame)
+        else:
+            # depth -> disparity -> uint8 over arena buffers, invalid (0) depth stays 0
+            dispF32 = arena.get(depthRaw.shape, np.float32)
+            valid = arena.get(depthRaw.shape, np.bool_)
+            np.not_equal(depthRaw, 0, out=valid)
+            # masked divide skips invalid pixels entirely (no inf, no errstate context), they keep the 0 fill
+            dispF32.fill(0)
+            np.divide(depthU8Scale, depthRaw, out=dispF32, where=valid)
+            np.clip(dispF32, 0, 255, out=dispF32)
+            dispFrame[...] = dispF32
+            arena.release(valid)
+            arena.release(dispF32)
+
+        colorFrame = PreviewDecoder.disparityColor(dispFrame, manager)
+        arena.release(dispFrame)
+        return colorFrame
 
-        maxDisp = manager._depthConfig.getMaxDisparity()
-        subpixelLevels = pow(2, manager._depthConfig.get().algorithmControl.subpixelFractionalBits)
-        subpixel = manager._depthConfig.get().algorithmControl.enableSubpixel
-        dispIntegerLevels = maxDisp if not subpixel else maxDisp / subpixelLevels
-        dispScaleFactor = getattr(manager, "dispScaleFactor", None)
-        if dispScaleFactor is None:
-            baseline = getattr(manager, 'baseline', 75)  # mm
-            fov = getattr(manager, 'fov', 71.86)
-            focal = getattr(manager, 'focal', depthRaw.shape[1] / (2. * math.tan(math.radians(fov / 2))))
-            dispScaleFactor = baseline * focal
-            if manager is not None:
-                setattr(manager, "dispScaleFactor", dispScaleFactor)
-        with np.errstate(divide='ignore'):
-            dispFrame = dispScaleFactor / depthRaw
+    @staticmethod
+    def _depthColorCuda(depthRaw, depthU8Scale, manager):
+        """
+        Converts raw depth frame to colorized disparity on the GPU, reusing buffers cached on the manager
 
-        dispFrame = (dispFrame * 255. / dispIntegerLevels).astype(np.uint8)
+        Args:
+            depthRaw (numpy.ndarray): OpenCV frame containing raw depth frame
+            depthU8Scale (float): Scale converting depth into uint8 disparity
+            manager (depthai_sdk.managers.PreviewManager): PreviewManager instance
 
-        return PreviewDecoder.disparityColor(dispFrame, manager)
+        Returns:
+            numpy.ndarray: Ready to use OpenCV frame
+        """
+        gpu = manager._depthCudaScratch
+        if gpu is None or gpu.shape != depthRaw.shape:
+            gpu = manager._depthCudaScratch = _CudaDepthScratch(depthRaw.shape)
+        if gpu.scaleValue != depthU8Scale:
+            gpu.scale.upload(np.full(depthRaw.shape, depthU8Scale, dtype=np.float32))
+            gpu.scaleValue = depthU8Scale
+        lut = manager._previewConfig.colorMapLut
+        if gpu.lutSource is not lut:
+            gpu.lut = cv2.cuda.createLookUpTable(lut.reshape(1, 256, 3))
+            gpu.lutSource = lut
+
+        stream = gpu.stream
+        gpu.depth.upload(depthRaw, stream)
+        gpu.depth.convertTo(cv2.CV_32FC1, stream, gpu.depthF32)
+        cv2.cuda.threshold(gpu.depthF32, 0, _CudaDepthScratch.INVALID_OFFSET, cv2.THRESH_BINARY_INV, gpu.invalid, stream)
+        cv2.cuda.add(gpu.depthF32, gpu.invalid, gpu.depthF32, stream=stream)
+        cv2.cuda.divide(gpu.scale, gpu.depthF32, gpu.dispF32, stream=stream)
+        gpu.dispF32.convertTo(cv2.CV_8UC1, stream, gpu.disp)
+        cv2.cuda.cvtColor(gpu.disp, cv2.COLOR_GRAY2BGR, gpu.dispBgr, stream=stream)
+        gpu.lut.transform(gpu.dispBgr, gpu.color, stream)
+        stream.waitForCompletion()
+        return gpu.color.download()
 
     @staticmethod
     def disparity(packet, manager=None):
@@ -208,7 +441,9 @@ class PreviewDecoder:
             rawFrame = PreviewDecoder.jpegDecode(packet.getData(), cv2.IMREAD_GRAYSCALE)
         else:
             rawFrame = packet.getFrame()
-        return (rawFrame * (manager.dispMultiplier if manager is not None else 255 / 96)).astype(np.uint8)
+        # multiply + saturating cast to uint8 in a single pass
+        cfg = manager._previewConfig if manager is not None else _DEFAULT_PREVIEW_CONFIG
+        return cv2.convertScaleAbs(rawFrame, alpha=cfg.dispMultiplier)
 
     @staticmethod
     def disparityColor(disparity, manager=None):
@@ -222,7 +457,74 @@ class PreviewDecoder:
         Returns:
             numpy.ndarray: Ready to use OpenCV frame
         """
-        return cv2.applyColorMap(disparity, manager.colorMap if manager is not None else cv2.COLORMAP_JET)
+        cfg = manager._previewConfig if manager is not None else _DEFAULT_PREVIEW_CONFIG
+        if cfg.colorMapLut is None:
+            return cv2.applyColorMap(disparity, cfg.colorMap if cfg.colorMap is not None else cv2.COLORMAP_JET)
+        # cached LUT passed as user color map - single gray -> BGR gather, no GRAY2BGR expansion pass
+        return cv2.applyColorMap(disparity, cfg.colorMapLut)
+
+    @staticmethod
+    def buildColorMapLut(colorMap=None):
+        """
+        Builds 256-entry BGR lookup table for the color map
+
+        Args:
+            colorMap (cv2 color map, optional): OpenCV color map id or custom lookup table, defaults to :code:`cv2.COLORMAP_JET`
+
+        Returns:
+            numpy.ndarray: Lookup table of shape (256, 1, 3)
+        """
+        return cv2.applyColorMap(np.arange(256, dtype=np.uint8).reshape(256, 1),
+                                 colorMap if colorMap is not None else cv2.COLORMAP_JET)
+
+    @staticmethod
+    def disparityColor565(disparity, manager=None):
+        """
+        Applies color map to disparity frame, producing BGR565 output (2 bytes per pixel instead of 3).
+
+        Meant for consumers able to display BGR565 frames directly (e.g. SDL/GTK surfaces or remote displays),
+        use :code:`cv2.cvtColor(frame.view(np.uint8).reshape(*frame.shape, 2), cv2.COLOR_BGR5652BGR)` to convert back.
+
+        Args:
+            disparity (numpy.ndarray): OpenCV frame containing disparity frame
+            manager (depthai_sdk.managers.PreviewManager, optional): PreviewManager instance
+
+        Returns:
+            numpy.ndarray: uint16 frame with BGR565 pixels
+        """
+        if manager is None:
+            return PreviewDecoder._defaultColorMapLut565()[disparity]
+        cfg = manager._previewConfig
+        lut565 = cfg.colorMapLut565
+        if lut565 is None:
+            # built on first use only, most managers never produce BGR565 frames
+            lut565 = PreviewDecoder.buildColorMapLut565(cfg.colorMapLut)
+            manager._previewConfig = cfg._replace(colorMapLut565=lut565)
+        return lut565[disparity]
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _defaultColorMapLut565():
+        """
+        Builds BGR565 lookup table for :code:`cv2.COLORMAP_JET`, memoized for decoding without a manager
+
+        Returns:
+            numpy.ndarray: uint16 lookup table of shape (256,)
+        """
+        return PreviewDecoder.buildColorMapLut565(PreviewDecoder.buildColorMapLut())
+
+    @staticmethod
+    def buildColorMapLut565(colorMapLut):
+        """
+        Converts BGR color map lookup table into BGR565 one
+
+        Args:
+            colorMapLut (numpy.ndarray): BGR lookup table, as returned by :meth:`buildColorMapLut`
+
+        Returns:
+            numpy.ndarray: uint16 lookup table of shape (256,)
+        """
+        return cv2.cvtColor(colorMapLut.reshape(1, 256, 3), cv2.COLOR_BGR2BGR565).view(np.uint16).reshape(256)
 
 
 class Previews(enum.Enum):
@@ -245,18 +547,46 @@ class Previews(enum.Enum):
     disparityColor = partial(PreviewDecoder.disparityColor)
 
 
+#: dict: Maps preview name to its decode function, bypassing the enum lookup and :code:`partial` wrapper on hot paths
+PREVIEW_DECODERS = {preview.name: preview.value.func for preview in Previews}
+
+_DEPTH_NAMES = frozenset((Previews.depthRaw.name, Previews.depth.name))
+_DISPARITY_NAMES = frozenset((Previews.disparityColor.name, Previews.disparity.name))
+_RECTIFIED_NAMES = frozenset((Previews.rectifiedLeft.name, Previews.rectifiedRight.name))
+
+
 class MouseClickTracker:
     """
     Class that allows to track the click events on preview windows and show pixel value of a frame in coordinates pointed
     by the user.
 
+    :attr:`points` and :attr:`values` are read-only snapshots (they used to be mutable dicts), modifying them raises
+    an error. Points are selected with the :meth:`selectPoint` callback and values are set by :meth:`extractValue`.
+
     Used internally by :obj:`depthai_sdk.managers.PreviewManager`
     """
 
-    #: dict: Stores selected point position per frame
-    points = {}
-    #: dict: Stores values assigned to specific point per frame
-    values = {}
+    __slots__ = ('_active', '_formatters')
+
+    def __init__(self):
+        # [name, point, formatter, value] entry per frame with a selected point, usually none or just a few
+        self._active = []
+        # name -> value formatter, resolved on first extraction as the frame layout is stable per preview
+        self._formatters = {}
+
+    @property
+    def points(self):
+        """
+        mappingproxy: Read-only snapshot of selected point position per frame
+        """
+        return MappingProxyType({entry[0]: entry[1] for entry in self._active})
+
+    @property
+    def values(self):
+        """
+        mappingproxy: Read-only snapshot of values assigned to specific point per frame
+        """
+        return MappingProxyType({entry[0]: entry[3] for entry in self._active if entry[3] is not None})
 
     def selectPoint(self, name):
         """
@@ -280,15 +610,47 @@ class MouseClickTracker:
 
         def cb(event, x, y, flags, param):
             if event == cv2.EVENT_LBUTTONUP:
-                if self.points.get(name) == (x, y):
-                    del self.points[name]
-                    if name in self.values:
-                        del self.values[name]
-                else:
-                    self.points[name] = (x, y)
+                for i, entry in enumerate(self._active):
+                    if entry[0] == name:
+                        if entry[1] == (x, y):
+                            del self._active[i]
+                        else:
+                            entry[1] = (x, y)
+                        return
+                self._active.append([name, (x, y), self._formatters.get(name), None])
 
         return cb
 
+    def getPoint(self, name):
+        """
+        Returns point selected on a specific frame
+
+        Args:
+            name (str): Name of the frame
+
+        Returns:
+            tuple: Selected point position, :code:`None` if no point is selected
+        """
+        for entry in self._active:
+            if entry[0] == name:
+                return entry[1]
+        return None
+
+    def getValue(self, name):
+        """
+        Returns value extracted for the point selected on a specific frame
+
+        Args:
+            name (str): Name of the frame
+
+        Returns:
+            str: Extracted value, :code:`None` if not available
+        """
+        for entry in self._active:
+            if entry[0] == name:
+                return entry[3]
+        return None
+
     def extractValue(self, name, frame: np.ndarray):
         """
         Extracts value from frame for a specific point
@@ -296,15 +658,26 @@ class MouseClickTracker:
         Args:
             name (str): Name of the frame
         """
-        point = self.points.get(name, None)
-        if point is not None and frame is not None:
-            if name in (Previews.depthRaw.name, Previews.depth.name):
-                self.values[name] = "{}mm".format(frame[point[1]][point[0]])
-            elif name in (Previews.disparityColor.name, Previews.disparity.name):
-                self.values[name] = "{}px".format(frame[point[1]][point[0]])
-            elif len(frame.shape) == 3:
-                self.values[name] = "R:{},G:{},B:{}".format(*frame[point[1]][point[0]][::-1])
-            elif len(frame.shape) == 2:
-                self.values[name] = "Gray:{}".format(frame[point[1]][point[0]])
-            else:
-                self.values[name] = str(frame[point[1]][point[0]])
+        if frame is None:
+            return
+        for entry in self._active:
+            if entry[0] == name:
+                formatter = entry[2]
+                if formatter is None:
+                    formatter = entry[2] = self._formatters[name] = self._resolveFormatter(name, frame)
+                x, y = entry[1]
+                entry[3] = formatter(frame, y, x)
+                return
+
+    @staticmethod
+    def _resolveFormatter(name, frame):
+        if name in _DEPTH_NAMES:
+            return lambda f, y, x: "{}mm".format(f[y, x])
+        elif name in _DISPARITY_NAMES:
+            return lambda f, y, x: "{}px".format(f[y, x])
+        elif len(frame.shape) == 3:
+            return lambda f, y, x: "R:{},G:{},B:{}".format(*f[y, x][::-1])
+        elif len(frame.shape) == 2:
+            return lambda f, y, x: "Gray:{}".format(f[y, x])
+        else:
+            return lambda f, y, x: str(f[y, x])
@@ -0,0 +1,97 @@
+import types
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from depthai_sdk import Previews
+from depthai_sdk.managers import PreviewManager
+
+
+class _Queue:
+    """Output queue stand-in returning packets with predefined frames"""
+
+    def __init__(self, name, frames):
+        self._name = name
+        self._frames = iter(frames)
+
+    def getName(self):
+        return self._name
+
+    def tryGet(self):
+        frame = next(self._frames)
+        return types.SimpleNamespace(getFrame=lambda: frame, getCvFrame=lambda: frame)
+
+    def get(self):
+        return self.tryGet()
+
+    def close(self):
+        pass
+
+
+class _Device:
+    """Device stand-in creating output queues without frames"""
+
+    def getOutputQueue(self, name, maxSize, blocking):
+        return _Queue(name, [])
+
+
+class TestPreviewManager(unittest.TestCase):
+
+    def _manager(self, frames):
+        pm = PreviewManager(display=list(frames), createWindows=False)
+        pm.outputQueues = [_Queue(name, streamFrames) for name, streamFrames in frames.items()]
+        return pm
+
+    def test_FrameLifetime(self):
+        """Testing that frame held from one prepareFrames call is not modified by the following calls"""
+        left = [np.full((4, 4), value, dtype=np.uint8) for value in (1, 2, 3)]
+        right = [np.full((4, 4), value, dtype=np.uint8) for value in (11, 12, 13)]
+        pm = self._manager({Previews.left.name: left, Previews.right.name: right})
+        pm.prepareFrames()
+        heldLeft = pm.get(Previews.left.name)
+        heldRight = pm.get(Previews.right.name)
+        pm.prepareFrames()
+        pm.prepareFrames()
+        np.testing.assert_array_equal(heldLeft, left[0])
+        np.testing.assert_array_equal(heldRight, right[0])
+        np.testing.assert_array_equal(pm.get(Previews.left.name), left[2])
+        np.testing.assert_array_equal(pm.get(Previews.right.name), right[2])
+
+
+    def test_CallbackContiguous(self):
+        """Testing that frames passed to prepareFrames callback are C-contiguous"""
+        frame = np.arange(16, dtype=np.uint8).reshape(4, 4)[:, ::-1]
+        pm = self._manager({Previews.left.name: [frame]})
+        received = []
+        pm.prepareFrames(callback=lambda f, name: received.append(f))
+        self.assertTrue(received[0].flags.c_contiguous)
+        np.testing.assert_array_equal(received[0], frame)
+
+    @mock.patch("depthai_sdk.managers.preview_manager.ThreadPoolExecutor")
+    def test_DecodePool(self, executor):
+        """Testing that decode pool is created only when enabled for decoded streams and replaced on queue recreation"""
+        display = [Previews.left.name, Previews.right.name]
+        pm = PreviewManager(display=display, createWindows=False, parallelDecode=True)
+        pm.createQueues(_Device())
+        pm = PreviewManager(display=display, createWindows=False, decode=True)
+        pm.createQueues(_Device())
+        executor.assert_not_called()
+
+        executor.side_effect = lambda **kwargs: mock.Mock()
+        pm = PreviewManager(display=display, createWindows=False, decode=True, parallelDecode=True)
+        with mock.patch("os.sched_getaffinity", return_value={0}, create=True):
+            pm.createQueues(_Device())
+        executor.assert_called_once_with(max_workers=1)
+        firstPool = pm._decodePool
+        pm.createQueues(_Device())
+        secondPool = pm._decodePool
+        firstPool.shutdown.assert_called_once_with()
+        self.assertIsNot(secondPool, firstPool)
+        pm.closeQueues()
+        secondPool.shutdown.assert_called_once_with()
+        self.assertIsNone(pm._decodePool)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,282 @@
+import types
+import unittest
+from unittest import mock
+
+import cv2
+import numpy as np
+
+from depthai_sdk import previews
+from depthai_sdk.managers import PreviewManager
+from depthai_sdk.previews import FrameArena, MouseClickTracker, PreviewDecoder, Previews
+
+
+class _DepthConfig:
+    """Minimal stand-in for depthai.StereoDepthConfig used by depth <-> disparity calculations"""
+
+    def getMaxDisparity(self):
+        return 95
+
+    def get(self):
+        algorithmControl = types.SimpleNamespace(enableSubpixel=False, subpixelFractionalBits=3)
+        return types.SimpleNamespace(algorithmControl=algorithmControl)
+
+
+def _packet(frame=None, data=None):
+    return types.SimpleNamespace(getFrame=lambda: frame, getCvFrame=lambda: frame, getData=lambda: data)
+
+
+class _Turbo:
+    """PyTurboJPEG stand-in decoding every frame to the given shape, rejecting dst of other shape like PyTurboJPEG"""
+
+    def __init__(self, shape):
+        self.shape = shape
+
+    def decode(self, data, flags=0, pixel_format=0, dst=None):
+        if dst is None:
+            dst = np.empty(self.shape, dtype=np.uint8)
+        elif dst.shape != self.shape:
+            raise ValueError("dst shape does not match the decoded frame")
+        dst[:] = data[0]
+        return dst
+
+
+def _patchTurbo(turbo):
+    patches = [mock.patch.object(previews, "turbo", turbo), mock.patch.object(previews, "_turboDecodeDst", True)]
+    for name in ("TJFLAG_FASTUPSAMPLE", "TJFLAG_FASTDCT", "TJPF_GRAY", "TJPF_BGR"):
+        patches.append(mock.patch.object(previews, name, 0, create=True))
+    for patch in patches:
+        patch.start()
+    return patches
+
+
+def _click(tracker, name, x, y):
+    tracker.selectPoint(name)(cv2.EVENT_LBUTTONUP, x, y, 0, None)
+
+
+class TestMouseClickTracker(unittest.TestCase):
+
+    def test_Instances(self):
+        """Testing that two trackers don't share selected points and values"""
+        first = MouseClickTracker()
+        second = MouseClickTracker()
+        _click(first, Previews.left.name, 1, 2)
+        first.extractValue(Previews.left.name, np.zeros((4, 4), dtype=np.uint8))
+        self.assertEqual(first.points, {Previews.left.name: (1, 2)})
+        self.assertEqual(second.points, {})
+        self.assertEqual(second.values, {})
+
+    def test_SelectPoint(self):
+        """Testing that clicking the same point again deselects it and clicking elsewhere moves it"""
+        tracker = MouseClickTracker()
+        _click(tracker, Previews.left.name, 1, 2)
+        self.assertEqual(tracker.getPoint(Previews.left.name), (1, 2))
+        _click(tracker, Previews.left.name, 3, 0)
+        self.assertEqual(tracker.getPoint(Previews.left.name), (3, 0))
+        tracker.extractValue(Previews.left.name, np.zeros((4, 4), dtype=np.uint8))
+        _click(tracker, Previews.left.name, 3, 0)
+        self.assertIsNone(tracker.getPoint(Previews.left.name))
+        self.assertIsNone(tracker.getValue(Previews.left.name))
+
+    def test_ExtractValue(self):
+        """Testing value formatting for depth, disparity, BGR and gray frames"""
+        tracker = MouseClickTracker()
+        gray = np.arange(20, dtype=np.uint16).reshape(4, 5)
+        bgr = np.arange(60, dtype=np.uint8).reshape(4, 5, 3)
+        for name in (Previews.depth.name, Previews.disparity.name, Previews.color.name, Previews.left.name):
+            _click(tracker, name, 2, 1)
+        tracker.extractValue(Previews.depth.name, gray)
+        tracker.extractValue(Previews.disparity.name, gray)
+        tracker.extractValue(Previews.color.name, bgr)
+        tracker.extractValue(Previews.left.name, gray)
+        self.assertEqual(tracker.values, {
+            Previews.depth.name: "7mm",
+            Previews.disparity.name: "7px",
+            Previews.color.name: "R:23,G:22,B:21",
+            Previews.left.name: "Gray:7",
+        })
+
+    def test_ReadOnlyViews(self):
+        """Testing that modifying points or values raises instead of being silently dropped"""
+        tracker = MouseClickTracker()
+        _click(tracker, Previews.left.name, 1, 2)
+        tracker.extractValue(Previews.left.name, np.zeros((4, 4), dtype=np.uint8))
+        with self.assertRaises(TypeError):
+            tracker.points[Previews.right.name] = (0, 0)
+        with self.assertRaises(AttributeError):
+            tracker.values.clear()
+        with self.assertRaises(AttributeError):
+            tracker.points = {}
+        self.assertEqual(tracker.points, {Previews.left.name: (1, 2)})
+        self.assertEqual(tracker.values, {Previews.left.name: "Gray:0"})
+
+    def test_ExtractValueNoPoint(self):
+        """Testing that nothing is extracted for frames without selected point"""
+        tracker = MouseClickTracker()
+        tracker.extractValue(Previews.left.name, np.zeros((4, 4), dtype=np.uint8))
+        self.assertEqual(tracker.values, {})
+
+
+class TestPreviewDecoder(unittest.TestCase):
+
+    def test_DisparitySaturation(self):
+        """Testing that scaled disparity saturates at 255 instead of wrapping around"""
+        pm = PreviewManager(display=[], dispMultiplier=255 / 96)
+        raw = np.array([[0, 48, 96, 200]], dtype=np.uint8)
+        frame = PreviewDecoder.disparity(_packet(raw), pm)
+        self.assertEqual(frame.dtype, np.uint8)
+        np.testing.assert_array_equal(frame, [[0, 128, 255, 255]])
+
+    def test_DepthSaturation(self):
+        """Testing that invalid depth maps to 0 and very close depth saturates at 255"""
+        pm = PreviewManager(display=[], depthConfig=_DepthConfig())
+        depthRaw = np.array([[0, 1, 75 * 440 * 255 // 95 // 100]], dtype=np.uint16)
+        PreviewDecoder.depth(depthRaw, pm)
+        pm.dispScaleFactor = 75 * 440
+        frame = PreviewDecoder.depth(depthRaw, pm)
+        lut = pm._previewConfig.colorMapLut.reshape(256, 3)
+        np.testing.assert_array_equal(frame[0], lut[[0, 255, 100]])
+
+    def test_DepthScaleUpdate(self):
+        """Testing that depth frames follow dispScaleFactor, baseline and focal changes made after the first frame"""
+        pm = PreviewManager(display=[], depthConfig=_DepthConfig())
+        lut = pm._previewConfig.colorMapLut.reshape(256, 3)
+        depthRaw = np.array([[75 * 440 * 255 // 95 // 50]], dtype=np.uint16)
+        pm.baseline = 75
+        pm.focal = 440
+        np.testing.assert_array_equal(PreviewDecoder.depth(depthRaw, pm)[0], lut[[50]])
+        self.assertEqual(pm.dispScaleFactor, 75 * 440)
+        pm.dispScaleFactor *= 2
+        np.testing.assert_array_equal(PreviewDecoder.depth(depthRaw, pm)[0], lut[[100]])
+        pm.baseline = 75 / 2
+        np.testing.assert_array_equal(PreviewDecoder.depth(depthRaw, pm)[0], lut[[25]])
+        self.assertEqual(pm.dispScaleFactor, 75 / 2 * 440)
+
+    def test_DepthCudaOptIn(self):
+        """Testing that depth is colorized on GPU only when enabled with useCuda"""
+        depthRaw = np.ones((4, 4), dtype=np.uint16)
+        gpuFrame = np.zeros((4, 4, 3), dtype=np.uint8)
+        with mock.patch.object(previews, "_cudaEnabled", return_value=True), \
+                mock.patch.object(PreviewDecoder, "_depthColorCuda", return_value=gpuFrame) as depthColorCuda:
+            PreviewDecoder.depth(depthRaw, PreviewManager(display=[], depthConfig=_DepthConfig()))
+            depthColorCuda.assert_not_called()
+            frame = PreviewDecoder.depth(depthRaw, PreviewManager(display=[], depthConfig=_DepthConfig(), useCuda=True))
+            self.assertIs(frame, gpuFrame)
+
+    @unittest.skipIf(previews._depthToU8 is None, "numba is not installed")
+    def test_DepthNumbaNumpy(self):
+        """Testing that Numba and NumPy depth conversions produce the same frame"""
+        pm = PreviewManager(display=[], depthConfig=_DepthConfig())
+        depthRaw = np.random.default_rng(0).integers(0, 8000, (40, 64)).astype(np.uint16)
+        depthRaw[:4] = 0
+        numbaFrame = PreviewDecoder.depth(depthRaw, pm)
+        with mock.patch.object(previews, "_depthToU8", None):
+            numpyFrame = PreviewDecoder.depth(depthRaw, pm)
+        np.testing.assert_array_equal(numbaFrame, numpyFrame)
+
+    def test_DisparityColor(self):
+        """Testing that disparity color map matches cv2.applyColorMap"""
+        disparity = np.arange(256, dtype=np.uint8).reshape(16, 16)
+        np.testing.assert_array_equal(PreviewDecoder.disparityColor(disparity),
+                                      cv2.applyColorMap(disparity, cv2.COLORMAP_JET))
+
+    def test_DisparityColor565(self):
+        """Testing that BGR565 color map matches cv2.applyColorMap converted to BGR565, with and without manager"""
+        disparity = np.arange(256, dtype=np.uint8).reshape(16, 16)
+        expected = cv2.cvtColor(cv2.applyColorMap(disparity, cv2.COLORMAP_JET), cv2.COLOR_BGR2BGR565).view(np.uint16)
+        np.testing.assert_array_equal(PreviewDecoder.disparityColor565(disparity), expected[:, :, 0])
+
+        pm = PreviewManager(display=[])
+        self.assertIsNone(pm._previewConfig.colorMapLut565)
+        expected = cv2.cvtColor(cv2.applyColorMap(disparity, pm.colorMap), cv2.COLOR_BGR2BGR565).view(np.uint16)
+        np.testing.assert_array_equal(PreviewDecoder.disparityColor565(disparity, pm), expected[:, :, 0])
+        self.assertIsNotNone(pm._previewConfig.colorMapLut565)
+
+    @unittest.skipIf(previews.turbo is not None or previews.simplejpeg is None, "simplejpeg decode path not in use")
+    def test_JpegDecodeResize(self):
+        """Testing that decoding falls back to a new array when the provided buffer is too small"""
+        small = cv2.imencode(".jpg", np.full((8, 16, 3), 128, dtype=np.uint8))[1]
+        large = cv2.imencode(".jpg", np.full((16, 32, 3), 128, dtype=np.uint8))[1]
+        first = PreviewDecoder.jpegDecode(small, cv2.IMREAD_COLOR)
+        reused = PreviewDecoder.jpegDecode(small, cv2.IMREAD_COLOR, first)
+        self.assertTrue(np.shares_memory(first, reused))
+        resized = PreviewDecoder.jpegDecode(large, cv2.IMREAD_COLOR, first)
+        self.assertEqual(resized.shape, (16, 32, 3))
+        self.assertFalse(np.shares_memory(first, resized))
+
+    def test_DecodeFrameLifetime(self):
+        """Testing that decoded frames are not overwritten by the next frame unless buffer reuse is enabled"""
+        dark = cv2.imencode(".jpg", np.zeros((8, 16, 3), dtype=np.uint8))[1]
+        bright = cv2.imencode(".jpg", np.full((8, 16, 3), 255, dtype=np.uint8))[1]
+        pm = PreviewManager(display=[], decode=True)
+        held = PreviewDecoder.color(_packet(data=dark), pm)
+        expected = held.copy()
+        PreviewDecoder.color(_packet(data=bright), pm)
+        np.testing.assert_array_equal(held, expected)
+        self.assertEqual(pm._decodeBuffers, {})
+
+    def test_TurboDecodeDst(self):
+        """Testing that PyTurboJPEG decodes into provided buffer when its shape matches the frame"""
+        for patch in _patchTurbo(_Turbo((8, 16))):
+            self.addCleanup(patch.stop)
+        dst = np.zeros((8, 16), dtype=np.uint8)
+        frame = PreviewDecoder.jpegDecode(np.array([7], dtype=np.uint8), cv2.IMREAD_GRAYSCALE, dst)
+        self.assertIs(frame, dst)
+        np.testing.assert_array_equal(dst, 7)
+
+    def test_TurboDecodeDstResize(self):
+        """Testing that PyTurboJPEG decoding falls back to a new array when provided buffer has other shape"""
+        for patch in _patchTurbo(_Turbo((16, 32))):
+            self.addCleanup(patch.stop)
+        dst = np.zeros((8, 16), dtype=np.uint8)
+        frame = PreviewDecoder.jpegDecode(np.array([7], dtype=np.uint8), cv2.IMREAD_GRAYSCALE, dst)
+        self.assertEqual(frame.shape, (16, 32))
+        self.assertFalse(np.shares_memory(frame, dst))
+        np.testing.assert_array_equal(dst, 0)
+        np.testing.assert_array_equal(frame, 7)
+
+    def test_TurboReuseDecodeBuffers(self):
+        """Testing that manager reuses previous frame as PyTurboJPEG buffer only with reuseDecodeBuffers enabled"""
+        for patch in _patchTurbo(_Turbo((8, 16))):
+            self.addCleanup(patch.stop)
+        pm = PreviewManager(display=[], decode=True, reuseDecodeBuffers=True)
+        first = PreviewDecoder.left(_packet(data=np.array([1], dtype=np.uint8)), pm)
+        second = PreviewDecoder.left(_packet(data=np.array([2], dtype=np.uint8)), pm)
+        self.assertIs(first, second)
+        pm = PreviewManager(display=[], decode=True)
+        first = PreviewDecoder.left(_packet(data=np.array([1], dtype=np.uint8)), pm)
+        PreviewDecoder.left(_packet(data=np.array([2], dtype=np.uint8)), pm)
+        np.testing.assert_array_equal(first, 1)
+
+
+class TestFrameArena(unittest.TestCase):
+
+    def test_Reuse(self):
+        """Testing that released buffer is handed out again for the same shape and dtype"""
+        arena = FrameArena()
+        buffer = arena.get((4, 6), np.uint8)
+        self.assertEqual((buffer.shape, buffer.dtype), ((4, 6), np.uint8))
+        arena.release(buffer)
+        self.assertIs(arena.get((4, 6), "uint8"), buffer)
+
+    def test_SeparateKeys(self):
+        """Testing that released buffer is not handed out for other shape or dtype"""
+        arena = FrameArena()
+        buffer = arena.get((4, 6), np.uint8)
+        arena.release(buffer)
+        self.assertIsNot(arena.get((6, 4), np.uint8), buffer)
+        self.assertIsNot(arena.get((4, 6), np.float32), buffer)
+        self.assertIs(arena.get((4, 6), np.uint8), buffer)
+
+    def test_Outstanding(self):
+        """Testing that buffers not released yet are never handed out twice"""
+        arena = FrameArena()
+        first = arena.get((4, 6), np.uint8)
+        second = arena.get((4, 6), np.uint8)
+        self.assertFalse(np.shares_memory(first, second))
+        arena.release(first)
+        self.assertIs(arena.get((4, 6), np.uint8), first)
+        self.assertIsNot(arena.get((4, 6), np.uint8), second)
+
+
+if __name__ == '__main__':
+    unittest.main()